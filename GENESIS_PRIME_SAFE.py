@@ -10,7 +10,10 @@ import sys
 import json
 import time
 import subprocess
+import atexit
 import logging
+import logging.handlers
+import queue
 import hashlib
 import platform
 from datetime import datetime
@@ -39,18 +42,28 @@ class RealityValidator:
         self.log_dir = Path(log_dir)
         self.log_dir.mkdir(exist_ok=True, parents=True)
         self.audit_log = self.log_dir / f"reality_audit_{datetime.now().strftime('%Y%m%d')}.log"
-        self._init_logging()
         self.operation_counter = 0
+        self._init_logging()
 
     def _init_logging(self):
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s | %(levelname)s | %(message)s',
-            handlers=[
-                logging.FileHandler(self.audit_log),
-                logging.StreamHandler()
-            ]
-        )
+        # Only the first validator configures logging: for later ones basicConfig is
+        # a no-op, and a listener/file handler would leak without ever being fed
+        if not logging.getLogger().handlers:
+            # File/console writes happen on the listener thread; callers only enqueue
+            formatter = logging.Formatter('%(asctime)s | %(levelname)s | %(message)s')
+            sinks = [logging.FileHandler(self.audit_log), logging.StreamHandler()]
+            for sink in sinks:
+                sink.setFormatter(formatter)
+            log_queue = queue.Queue(-1)
+            listener = logging.handlers.QueueListener(log_queue, *sinks)
+            listener.start()
+            # Stopping the listener drains the queue so no audit entry is lost at exit
+            atexit.register(listener.stop)
+            logging.basicConfig(
+                level=logging.INFO,
+                format='%(message)s',
+                handlers=[logging.handlers.QueueHandler(log_queue)]
+            )
         self.log_event("SYSTEM_BOOT", "Reality Validation Engine Initialized", {"guid": OPERATOR_GUID})
 
     def generate_evidence_hash(self, data: Any) -> Dict[str, str]:
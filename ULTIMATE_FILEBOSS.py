@@ -5,8 +5,39 @@
 import os, sys, hashlib, shutil, json, argparse
 from pathlib import Path
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 import mimetypes
 
+CATEGORIES = {
+    'docs': ['.md', '.txt', '.pdf', '.docx'],
+    'scripts': ['.sh', '.py', '.js'],
+    'configs': ['.json', '.yaml', '.yml', '.env'],
+    'evidence': ['.jpg', '.png', '.pdf', '.wav', '.mp4']
+}
+
+# Extension -> category lookup; first listed category wins (.pdf -> docs)
+EXT_CATEGORY = {}
+for _cat, _exts in CATEGORIES.items():
+    for _ext in _exts:
+        EXT_CATEGORY.setdefault(_ext, _cat)
+
+def walk_files(root):
+    """Yield os.DirEntry for every regular file under root (scandir-based)"""
+    # Same order as Path.rglob: a directory's own files before its subdirectories,
+    # which decides the "first occurrence" kept by duplicate handling
+    subdirs = []
+    try:
+        with os.scandir(root) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif entry.is_file():
+                    yield entry
+    except OSError:
+        return
+    for subdir in subdirs:
+        yield from walk_files(subdir)
+
 class UltimateFileBoss:
     def __init__(self, input_dir, output_dir=None, mode='organize'):
         self.input = Path(input_dir).resolve()
@@ -16,45 +47,46 @@ class UltimateFileBoss:
             self.output.mkdir(exist_ok=True)
         self.exhibits = []
         self.duplicates = {}
-        self.categories = {
-            'docs': ['.md', '.txt', '.pdf', '.docx'],
-            'scripts': ['.sh', '.py', '.js'],
-            'configs': ['.json', '.yaml', '.yml', '.env'],
-            'evidence': ['.jpg', '.png', '.pdf', '.wav', '.mp4']
-        }
+        self.file_hashes = {}  # path -> sha256 for files hashed by find_duplicates
+        self.stamp_date = datetime.now().strftime('%Y%m%d')
+        self.categories = CATEGORIES
         
-    def hash_file(self, path):
+    def hash_file(self, path, chunk_size=1 << 20):
         h = hashlib.sha256()
         try:
             with open(path, 'rb') as f: 
-                for chunk in iter(lambda: f.read(4096), b''):
+                for chunk in iter(lambda: f.read(chunk_size), b''):
                     h.update(chunk)
             return h.hexdigest()
-        except:
+        except OSError:
             return None
     
     def categorize_file(self, path):
-        ext = path.suffix.lower()
-        for cat, exts in self.categories.items():
-            if ext in exts:
-                return cat
-        return 'other'
+        return EXT_CATEGORY.get(path.suffix.lower(), 'other')
     
     def bates_stamp(self, filename, index, category=''):
-        timestamp = datetime.now().strftime('%Y%m%d')
         safe_name = Path(filename).stem[:30].replace(' ', '_')
-        return f"{category.upper()}-{index:04d}-{timestamp}-{safe_name}{Path(filename).suffix}"
+        return f"{category.upper()}-{index:04d}-{self.stamp_date}-{safe_name}{Path(filename).suffix}"
     
     def find_duplicates(self):
         """Find true duplicates across workspace"""
         hashes = {}
-        for file in self.input.rglob('*'):
-            if file.is_file() and file.stat().st_size > 1024:
-                h = self.hash_file(file)
+        # Files with a unique size cannot have a duplicate: only hash size collisions
+        by_size = {}
+        for entry in walk_files(self.input):
+            size = entry.stat().st_size
+            if size > 1024:
+                by_size.setdefault(size, []).append(entry.path)
+        paths = [path for group in by_size.values() if len(group) > 1 for path in group]
+        # hashlib releases the GIL on large buffers, so threads overlap IO and hashing;
+        # map() keeps walk order so "first occurrence" stays deterministic
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) + 4)) as pool:
+            for path, h in zip(paths, pool.map(self.hash_file, paths)):
                 if h:
+                    self.file_hashes[path] = h
                     if h not in hashes:
                         hashes[h] = []
-                    hashes[h].append(str(file))
+                    hashes[h].append(path)
         
         duplicates = {h: files for h, files in hashes.items() if len(files) > 1}
         self.duplicates = duplicates
@@ -89,12 +121,14 @@ class UltimateFileBoss:
                 dest = cat_dir / new_name
                 
                 if not dest.exists():
+                    # Reuse the dedupe pass hash; hash before the move otherwise
+                    h = self.file_hashes.get(str(file)) or self.hash_file(file)
                     shutil.move(str(file), str(dest))
                     self.exhibits.append({
                         'path': str(dest),
                         'original': str(file),
                         'category': cat,
-                        'hash': self.hash_file(file)
+                        'hash': h
                     })
                     moved += 1
         
@@ -102,12 +136,16 @@ class UltimateFileBoss:
         self.save_inventory()
     
     def save_inventory(self):
+        # Single pass over exhibits instead of one scan per category
+        counts = dict.fromkeys(self.categories, 0)
+        for e in self.exhibits:
+            if e['category'] in counts:
+                counts[e['category']] += 1
         inventory = {
             'summary': {
                 'total_files': len(self.exhibits),
                 'duplicates_found': len(self.duplicates),
-                'categories': {cat: len([e for e in self.exhibits if e['category']==cat]) 
-                              for cat in self.categories}
+                'categories': counts
             },
             'exhibits': self.exhibits,
             'duplicates': self.duplicates
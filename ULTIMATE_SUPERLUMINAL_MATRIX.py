@@ -2,13 +2,17 @@
 # ULTIMATE_SUPERLUMINAL_MATRIX v2.0 - glaciereq Case Matrix + FILEBOSS Integration
 # Features: Exhibit correlation + Timeline analysis + Case graphing + Auto-chaining
 
-import json, os, hashlib, argparse, networkx as nx
+import json, os, re, hashlib, argparse, networkx as nx
 from pathlib import Path
 from collections import defaultdict, Counter
 from datetime import datetime, timedelta
 import matplotlib.pyplot as plt
 from typing import Dict, List, Any
 
+# Entity patterns, compiled once for every exhibit scanned
+DATE_RE = re.compile(r'\b\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\b')
+AMOUNT_RE = re.compile(r'\$\d+(?:,\d{3})*(?:\.\d{2})?')
+
 class UltimateCaseMatrix:
     def __init__(self, exhibits_dir="organized", case_id="DEFAULT"):
         self.exhibits_dir = Path(exhibits_dir)
@@ -39,12 +43,9 @@ class UltimateCaseMatrix:
         # Names (capitalized words)
         entities.extend([w for w in text.split() if w[0].isupper() and len(w) > 2])
         # Dates (patterns)
-        import re
-        dates = re.findall(r'\b\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\b', text)
-        entities.extend(dates)
+        entities.extend(DATE_RE.findall(text))
         # Amounts
-        amounts = re.findall(r'\$\d+(?:,\d{3})*(?:\.\d{2})?', text)
-        entities.extend(amounts)
+        entities.extend(AMOUNT_RE.findall(text))
         return entities
     
     def build_correlation_graph(self):
@@ -75,13 +76,15 @@ class UltimateCaseMatrix:
     def generate_timeline(self):
         """Create chronological exhibit timeline"""
         timeline = []
+        append = timeline.append
         for exh in self.exhibits:
-            mod_time = datetime.fromtimestamp(Path(exh['path']).stat().st_mtime)
-            timeline.append({
-                'exhibit': exh['path'],
+            path = exh['path']
+            st = os.stat(path)  # one stat per exhibit for both mtime and size
+            append({
+                'exhibit': path,
                 'category': exh['category'],
-                'timestamp': mod_time.isoformat(),
-                'size': Path(exh['path']).stat().st_size
+                'timestamp': datetime.fromtimestamp(st.st_mtime).isoformat(),
+                'size': st.st_size
             })
         self.timeline = sorted(timeline, key=lambda x: x['timestamp'])
         return self.timeline
@@ -97,6 +100,10 @@ class UltimateCaseMatrix:
         self.build_correlation_graph()
         self.generate_timeline()
         
+        # Graph searches are reused by the markdown report; compute once per run
+        clusters = self._get_clusters()
+        chains = self._get_evidence_chains()
+        
         # Generate matrix views
         matrix = {
             'case_id': self.case_id,
@@ -109,8 +116,8 @@ class UltimateCaseMatrix:
             },
             'views': {
                 'timeline': self.timeline[:50],  # Top 50
-                'clusters': self._get_clusters(),
-                'chains': self._get_evidence_chains(),
+                'clusters': clusters,
+                'chains': chains,
                 'stats': self._get_category_stats()
             },
             'graph': nx.readwrite.json_graph.node_link_data(self.graph)
@@ -121,7 +128,7 @@ class UltimateCaseMatrix:
             json.dump(matrix, f, indent=2)
         
         # Markdown summary
-        self._generate_markdown_report(output_path)
+        self._generate_markdown_report(output_path, clusters, chains)
         
         print(f"✅ CASE MATRIX generated: {output_path}")
         return matrix
@@ -149,7 +156,7 @@ class UltimateCaseMatrix:
         cats = Counter(e['category'] for e in self.exhibits)
         return dict(cats)
     
-    def _generate_markdown_report(self, json_path):
+    def _generate_markdown_report(self, json_path, clusters, chains):
         """Human-readable report"""
         report_path = self.exhibits_dir / f"CASE_MATRIX_{self.case_id}.md"
         with open(report_path, 'w') as f:
@@ -158,12 +165,12 @@ class UltimateCaseMatrix:
             f.write(f"**Exhibits**: {len(self.exhibits)} | **Connections**: {self.graph.number_of_edges()}\\n\\n")
             
             f.write("## 📊 Executive Summary\\n")
-            f.write(f"- **{len(self._get_clusters())} evidence clusters** detected\\n")
+            f.write(f"- **{len(clusters)} evidence clusters** detected\\n")
             f.write(f"- **{len(self.duplicates)} duplicate sets** eliminated\\n")
             f.write(f"- **{len(self.timeline)} item timeline** reconstructed\\n\\n")
             
             f.write("## 🔗 Key Connections\\n```json\\n")
-            f.write(json.dumps(self._get_evidence_chains(), indent=2)[:500] + "\\n```\\n")
+            f.write(json.dumps(chains, indent=2)[:500] + "\\n```\\n")
 
 def main():
     parser = argparse.ArgumentParser(description='ULTIMATE_SUPERLUMINAL_MATRIX')
@@ -40,16 +40,19 @@ class ApexMem0Master:
         return self.client.search(query=query, filters=filters)
 
     # --- TIER 3: CONCURRENCY (Async) ---
-    async def parallel_ingest(self, items: List[str], user_id: str):
+    async def parallel_ingest(self, items: List[str], user_id: str, max_concurrency: int = 5):
         """
         [Tier 3] High-speed parallel storage.
         """
         print(f"⚡ [Tier 3] Parallel Ingestion for {user_id}...")
-        tasks = [
-            self.async_client.add(messages=[{"role": "user", "content": item}], user_id=user_id)
-            for item in items
-        ]
-        return await asyncio.gather(*tasks, return_exceptions=True)
+        # Bounded fan-out: at most max_concurrency adds in flight, no batch barriers
+        sem = asyncio.Semaphore(max_concurrency)
+
+        async def _add(item: str):
+            async with sem:
+                return await self.async_client.add(messages=[{"role": "user", "content": item}], user_id=user_id)
+
+        return await asyncio.gather(*(_add(item) for item in items), return_exceptions=True)
 
     # --- TIER 4: INTEGRATION (Agent Schema) ---
     def agent_tool_schema(self):
@@ -13,12 +13,8 @@ async def main():
     sections = content.split("---")
     print(f"📦 Found {len(sections)} context sections. Starting Parallel Ingestion...")
     
-    # Process in batches to avoid overwhelming
-    batch_size = 5
-    for i in range(0, len(sections), batch_size):
-        batch = sections[i:i+batch_size]
-        print(f"⚡ Ingesting batch {i//batch_size + 1}...")
-        await apex.parallel_ingest(batch, "casey_admin")
+    # parallel_ingest caps in-flight requests, so no manual batching is needed
+    await apex.parallel_ingest(sections, "casey_admin", max_concurrency=5)
     
     print("✅ Ingestion Complete. Master Toolbox is now case-aware.")
 
@@ -22,7 +22,8 @@ class ApexMem0Master:
         """Real ingestion logic for A2S synthesis"""
         content = str(payload.get("agent_data", []))
         user_id = payload.get("case_id", "default_user")
-        return self.client.add(messages=[{"role": "user", "content": content}], user_id=user_id)
+        # MemoryClient.add is blocking HTTP; keep it off the event loop
+        return await asyncio.to_thread(self.client.add, messages=[{"role": "user", "content": content}], user_id=user_id)
 
     def system_audit(self):
         return {"status": "ACTIVE", "protocol": "APEX-v2", "orchestrator": "ONLINE"}
@@ -31,12 +32,15 @@ class ApexMem0Master:
         filters = {"AND": [{"user_id": user_id}]}
         return self.client.search(query=query, filters=filters)
 
-    async def parallel_ingest(self, items: List[str], user_id: str):
-        tasks = [
-            self.async_client.add(messages=[{"role": "user", "content": item}], user_id=user_id)
-            for item in items
-        ]
-        return await asyncio.gather(*tasks, return_exceptions=True)
+    async def parallel_ingest(self, items: List[str], user_id: str, max_concurrency: int = 5):
+        # Bounded fan-out: at most max_concurrency adds in flight, no batch barriers
+        sem = asyncio.Semaphore(max_concurrency)
+
+        async def _add(item: str):
+            async with sem:
+                return await self.async_client.add(messages=[{"role": "user", "content": item}], user_id=user_id)
+
+        return await asyncio.gather(*(_add(item) for item in items), return_exceptions=True)
 
     def store(self, content: str, user_id: str, metadata: Dict = None):
         asyncio.create_task(self.orchestrator.powerhouse_sync(content, user_id, "1FDV-23-0001009"))
@@ -23,6 +23,11 @@ class McpCliClient:
         except asyncio.TimeoutError:
             proc.kill()
             return {"ok": False, "error": "timeout", "args": ["mcp", *args]}
+        except asyncio.CancelledError:
+            # Caller gave up (e.g. a losing health probe); don't orphan the CLI process
+            proc.kill()
+            await proc.wait()
+            raise
 
         out_s = out.decode(errors="replace").strip()
         err_s = err.decode(errors="replace").strip()
@@ -19,7 +19,8 @@ class MultiMemoryOrchestrator:
         """Sinks data into the multi-memory backup layer"""
         content = str(payload.get("agent_data", []))
         user_id = f"{payload.get('case_id', 'default')}_backup"
-        return self.mem0_secondary.add(messages=[{"role": "user", "content": content}], user_id=user_id)
+        # MemoryClient.add is blocking HTTP; keep it off the event loop
+        return await asyncio.to_thread(self.mem0_secondary.add, messages=[{"role": "user", "content": content}], user_id=user_id)
 
     async def powerhouse_sync(self, content: str, user_id: str, case_id: str):
         self.mem0_primary.add(messages=[{"role": "user", "content": content}], user_id=user_id)
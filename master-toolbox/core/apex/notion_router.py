@@ -1,3 +1,4 @@
+import asyncio
 from typing import Dict, Any, List
 import time
 
@@ -5,28 +6,53 @@ class NotionMcpRouter:
     """
     Routes Notion calls to a canonical MCP server with fallbacks.
     """
-    def __init__(self, mcp_client, servers: List[str] = None):
+    def __init__(self, mcp_client, servers: List[str] = None, preferred_ttl_s: float = 300):
         self.mcp = mcp_client
         self.servers = servers or ["notion", "smithery-notion", "mingxiao300-notion-smithery"]
+        # Last server that answered; tried first until the TTL lapses
+        self.preferred_ttl_s = preferred_ttl_s
+        self._preferred = None
+        self._preferred_at = 0.0
+
+    def _remember(self, server: str) -> None:
+        self._preferred = server
+        self._preferred_at = time.monotonic()
+
+    def _ordered_servers(self) -> List[str]:
+        if self._preferred and time.monotonic() - self._preferred_at < self.preferred_ttl_s:
+            return [self._preferred] + [s for s in self.servers if s != self._preferred]
+        return self.servers
 
     async def health_check(self) -> Dict[str, Any]:
         """
         Basic health = can list tools for at least one Notion server.
         """
-        for s in self.servers:
-            res = await self.mcp.list_tools(s)
-            if res.get("ok"):
-                return {"ok": True, "server": s, "checked": self.servers}
+        # Probe all servers at once, but accept them in priority order: latency is
+        # bounded by the servers up to the first healthy one, never the slowest probe
+        probes = [asyncio.ensure_future(self.mcp.list_tools(s)) for s in self.servers]
+        try:
+            for s, probe in zip(self.servers, probes):
+                try:
+                    res = await probe
+                except Exception:
+                    continue
+                if res.get("ok"):
+                    self._remember(s)
+                    return {"ok": True, "server": s, "checked": self.servers}
+        finally:
+            for probe in probes:
+                probe.cancel()
         return {"ok": False, "error": "No Notion MCP server reachable", "checked": self.servers}
 
     async def call(self, tool: str, params: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Try canonical then fallbacks.
+        Try the recently working server (else canonical) then fallbacks.
         """
         last = None
-        for s in self.servers:
+        for s in self._ordered_servers():
             res = await self.mcp.call(s, tool, params)
             if res.get("ok"):
+                self._remember(s)
                 res["server"] = s
                 return res
             last = res
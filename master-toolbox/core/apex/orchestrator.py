@@ -128,14 +128,16 @@ class ApexOrchestrator:
         payload = {"op": "a2s.synthesize", "case_id": case_id, "agent_data": agent_data}
         self.audit.write({"stage": "A2S", "event": {"case_id": case_id, "agents": [a.get("agent") for a in agent_data]}})
         results = {}
-        try:
-            results["mem0_master"] = await self.engine.ingest(payload)
-        except Exception as e:
-            results["mem0_master"] = {"ok": False, "error": str(e)}
-        try:
-            results["multi_memory"] = await self.memory.sink(payload)
-        except Exception as e:
-            results["multi_memory"] = {"ok": False, "error": str(e)}
+        # Primary ingest and backup sink are independent writes; run them together
+        sinks = {"mem0_master": self.engine.ingest(payload), "multi_memory": self.memory.sink(payload)}
+        outcomes = await asyncio.gather(*sinks.values(), return_exceptions=True)
+        for name, res in zip(sinks, outcomes):
+            if isinstance(res, Exception):
+                results[name] = {"ok": False, "error": str(res)}
+            elif isinstance(res, BaseException):
+                raise res
+            else:
+                results[name] = res
         self.audit.write({"stage": "A2S", "result": results})
         return {"ok": True, "status": "synthesized", "results": results}
 
@@ -163,31 +165,26 @@ class ApexOrchestrator:
         steps: List[Dict[str, Any]] = []
         errors: List[Dict[str, Any]] = []
         self.audit.write({"stage": "RUN", "run_id": run_id, "case_id": case_id, "event": "powerhouse.start"})
-        try:
-            s1 = await self.a2s_synthesis([{"agent": "Operator", "note": case_update}], case_id=case_id)
-            steps.append({"step": "A2S", "result": s1})
-        except Exception as e:
-            errors.append({"step": "A2S", "error": str(e)})
-        try:
+        # Stages are independent round-trips: run them concurrently, report in stage order
+        stages = [
+            ("A2S", self.a2s_synthesis([{"agent": "Operator", "note": case_update}], case_id=case_id)),
             # Using real Supabase check via MCP Client
-            s2 = await self.mcp_bridge("supabase-f597", "execute_sql", {"sql": "SELECT 1"}, case_id=case_id)
-            steps.append({"step": "SUPABASE", "result": s2})
-        except Exception as e:
-            errors.append({"step": "SUPABASE", "error": str(e)})
-        try:
-            s3 = await self.e2b_execution("verify_file_integrity()", case_id=case_id, meta={"run_id": run_id})
-            steps.append({"step": "E2B", "result": s3})
-        except Exception as e:
-            errors.append({"step": "E2B", "error": str(e)})
-        try:
+            ("SUPABASE", self.mcp_bridge("supabase-f597", "execute_sql", {"sql": "SELECT 1"}, case_id=case_id)),
+            ("E2B", self.e2b_execution("verify_file_integrity()", case_id=case_id, meta={"run_id": run_id})),
             # Fixed Notion call params
-            s4 = await self.notion.call("append-block-children", {
+            ("NOTION", self.notion.call("append-block-children", {
                 "blockId": "172b1e4f322380b8bc63dc0726949795", 
                 "children": [{"object": "block", "type": "paragraph", "paragraph": {"rich_text": [{"type": "text", "text": {"content": f"[{time.ctime()}] APEX Update: {case_update}"}}]}}]
-            })
-            steps.append({"step": "NOTION", "result": s4})
-        except Exception as e:
-            errors.append({"step": "NOTION", "error": str(e)})
+            })),
+        ]
+        results = await asyncio.gather(*(coro for _, coro in stages), return_exceptions=True)
+        for (step, _), res in zip(stages, results):
+            if isinstance(res, Exception):
+                errors.append({"step": step, "error": str(res)})
+            elif isinstance(res, BaseException):
+                raise res
+            else:
+                steps.append({"step": step, "result": res})
         ok = len(errors) == 0
         self.audit.write({"stage": "RUN", "run_id": run_id, "case_id": case_id, "event": "powerhouse.end", "ok": ok, "errors": errors})
         return OrchestratorResult(ok=ok, run_id=run_id, steps=steps, errors=errors)
@@ -10,14 +10,17 @@ class FileBoss:
         self.output = Path(output_dir)
         self.output.mkdir(exist_ok=True)
         self.exhibits = []
+        self.stamp_date = datetime.now().strftime('%Y%m%d')
     
     def hash_file(self, path):
         h = hashlib.sha256()
-        with open(path, 'rb') as f: h.update(f.read())
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                h.update(chunk)
         return h.hexdigest()
     
     def bates_stamp(self, filename, index):
-        return f"EXH-{index:04d}-{datetime.now().strftime('%Y%m%d')}-{Path(filename).stem[:20]}.pdf"
+        return f"EXH-{index:04d}-{self.stamp_date}-{Path(filename).stem[:20]}.pdf"
     
     def organize(self):
         hashes = {}
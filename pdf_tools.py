@@ -31,12 +31,13 @@ from reportlab.pdfgen import canvas
 
 
 def extract_text(pdf_path: Path, out_path: Path) -> None:
-    with pdfplumber.open(pdf_path) as pdf:
-        parts = []
+    # Write page by page and drop each page's parsed objects, so memory stays
+    # bounded by one page rather than the whole document.
+    with pdfplumber.open(pdf_path) as pdf, out_path.open("w", encoding="utf-8") as out:
         for i, page in enumerate(pdf.pages, start=1):
             text = page.extract_text() or ""
-            parts.append(f"=== Page {i} ===\n{text}\n\n")
-    out_path.write_text("".join(parts), encoding="utf-8")
+            out.write(f"=== Page {i} ===\n{text}\n\n")
+            page.close()
 
 
 def extract_tables(pdf_path: Path, out_path: Path) -> None:
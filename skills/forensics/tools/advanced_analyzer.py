@@ -26,14 +26,20 @@ class ForensicAnalyzer:
         return libs
     
     def deep_hash(self, path):
-        hashes = {}
-        for algo in ['sha256', 'sha1', 'md5']:
-            try:
-                h = hashlib.new(algo)
-                with open(path, 'rb') as f: h.update(f.read())
-                hashes[algo] = h.hexdigest()
-            except: hashes[algo] = 'ERROR'
-        return hashes
+        # One chunked read feeds all digests; memory stays flat for huge evidence files
+        algos = ['sha256', 'sha1', 'md5']
+        hashes, digests = {}, {}
+        for algo in algos:
+            try: digests[algo] = hashlib.new(algo)
+            except ValueError: hashes[algo] = 'ERROR'  # digest unavailable (e.g. md5 on FIPS)
+        try:
+            with open(path, 'rb') as f:
+                for chunk in iter(lambda: f.read(1 << 20), b''):
+                    for h in digests.values(): h.update(chunk)
+        except OSError:
+            return {algo: 'ERROR' for algo in algos}
+        hashes.update({algo: h.hexdigest() for algo, h in digests.items()})
+        return {algo: hashes[algo] for algo in algos}
     
     def analyze(self, path):
         stat = path.stat()
@@ -18,16 +18,21 @@ class SupremeFSBoss:
         """Scan ALL filesystems including cloud drives"""
         print("🔍 Scanning Android + Cloud filesystems...")
         for path in self.root.rglob('*'):
-            if path.is_file() and path.stat().st_size > 0:
-                try:
-                    h = hashlib.sha256(path.read_bytes()[:1024]).hexdigest()  # Partial hash
+            try:
+                if not path.is_file():
+                    continue
+                st = path.stat()
+                if st.st_size > 0:
+                    with open(path, 'rb') as f:
+                        h = hashlib.sha256(f.read(1024)).hexdigest()  # Partial hash: read only the head
                     ext = path.suffix.lower()
                     self.map[str(path)] = {
-                        'hash': h, 'ext': ext, 'size': path.stat().st_size,
-                        'modified': datetime.fromtimestamp(path.stat().st_mtime).isoformat()
+                        'hash': h, 'ext': ext, 'size': st.st_size,
+                        'modified': datetime.fromtimestamp(st.st_mtime).isoformat()
                     }
                     self._intelligent_categorize(path)
-                except: continue
+            except OSError:
+                continue
         return self.map
     
     def _intelligent_categorize(self, path):
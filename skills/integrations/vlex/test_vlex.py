@@ -3,7 +3,7 @@ from unittest.mock import patch, MagicMock
 from skills.integrations.vlex.vlex_client import VlexClient
 
 class TestVlexClient(unittest.TestCase):
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_search_success(self, mock_get):
         mock_get.return_value.status_code = 200
         mock_get.return_value.json.return_value = {"results": [{"id": "1", "title": "Test case"}]}
@@ -15,7 +15,7 @@ class TestVlexClient(unittest.TestCase):
         self.assertEqual(len(results["results"]), 1)
         self.assertEqual(results["results"][0]["title"], "Test case")
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_document_success(self, mock_get):
         mock_get.return_value.status_code = 200
         mock_get.return_value.json.return_value = {"id": "1", "full_text": "Content"}
@@ -25,6 +25,15 @@ class VlexClient:
             "Accept": "application/json",
             "Content-Type": "application/json"
         }
+        # One pooled session so repeated calls reuse the TCP/TLS connection
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+
+    def close(self) -> None:
+        """
+        Release pooled connections.
+        """
+        self.session.close()
 
     def search(self, query: str, jurisdiction: str = "us_federal", limit: int = 10) -> Dict[str, Any]:
         """
@@ -38,7 +47,7 @@ class VlexClient:
         }
         
         try:
-            response = requests.get(url, headers=self.headers, params=params)
+            response = self.session.get(url, params=params)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
@@ -52,7 +61,7 @@ class VlexClient:
         url = f"{self.base_url}/documents/{doc_id}"
         
         try:
-            response = requests.get(url, headers=self.headers)
+            response = self.session.get(url)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e: